@@ -1,6 +1,7 @@
 #!/usr/bin/env node
-const { spawnSync } = require("node:child_process");
+const { spawn } = require("node:child_process");
 const { statSync, readdirSync } = require("node:fs");
+const { availableParallelism } = require("node:os");
 const path = require("node:path");
 
 const targets = ["public"]; // public/assets/tiles is already handled by public recursion
@@ -29,19 +30,35 @@ const run = async () => {
 
   targets.forEach(collectPngs);
 
-  const optimize = (file) => {
-    const before = statSync(file).size;
-    const args = ["-o", "6", "--strip", "all", "--zopfli", "--skip-if-larger", "--quiet", file];
-    const result = spawnSync(oxipng, args, { stdio: "pipe" });
-    if (result.error) {
-      console.error(`Failed ${file}: ${result.error.message}`);
-      return { file, before, after: before, ok: false };
+  // Each file is independent, so run one single-threaded oxipng per core
+  // instead of optimizing the whole list serially.
+  const workers = Math.max(1, Math.min(availableParallelism(), pngFiles.length));
+
+  const optimize = (file) =>
+    new Promise((resolve) => {
+      const before = statSync(file).size;
+      const args = ["-o", "6", "--strip", "all", "--zopfli", "--skip-if-larger", "--quiet", "--threads", "1", file];
+      const child = spawn(oxipng, args, { stdio: "ignore" });
+      child.on("error", (err) => {
+        console.error(`Failed ${file}: ${err.message}`);
+        resolve({ file, before, after: before, ok: false });
+      });
+      child.on("close", () => {
+        const after = statSync(file).size;
+        resolve({ file, before, after, ok: true });
+      });
+    });
+
+  const results = new Array(pngFiles.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < pngFiles.length) {
+      const index = next++;
+      results[index] = await optimize(pngFiles[index]);
     }
-    const after = statSync(file).size;
-    return { file, before, after, ok: true };
   };
+  await Promise.all(Array.from({ length: workers }, worker));
 
-  const results = pngFiles.map(optimize);
   const succeeded = results.filter((r) => r.ok);
   const totalBefore = succeeded.reduce((sum, r) => sum + r.before, 0);
   const totalAfter = succeeded.reduce((sum, r) => sum + r.after, 0);